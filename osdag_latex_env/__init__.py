@@ -1 +1 @@
-from .__main__ import OsdagLatexEnv
\ No newline at end of file
+from .__main__ import OsdagLatexEnv, PdflatexDaemon, get_env
@@ -1,60 +1,199 @@
+import itertools
 import os
 import shutil
 import sys
 import platform
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# The platform cannot change during the process lifetime; resolve it once.
+_SYSTEM = platform.system().lower()
+_MACHINE = platform.machine().lower()
+
+# TeX Live's per-platform subdirectory of bin/
+_PLATFORM_BIN = {
+    "windows": "x86_64-windows",
+    "linux": "x86_64-linux",
+    "darwin": "universal-darwin",
+}.get(_SYSTEM)
+
+_PDFLATEX_EXE = "pdflatex.exe" if _SYSTEM == "windows" else "pdflatex"
+
+# File extensions indexed by the binary registry
+_EXE_SUFFIXES = frozenset({".exe", ""}) if _SYSTEM == "windows" else frozenset({""})
+
+# Auxiliary files a TeX run reads back under \jobname on the next pass
+_AUX_SUFFIXES = (
+    ".aux", ".toc", ".lof", ".lot", ".out", ".bbl",
+    ".idx", ".ind", ".nav", ".snm", ".vrb",
+)
+
+# Job ids shared by every PdflatexDaemon in the process
+_JOB_IDS = itertools.count()
+
+def _stdio(quiet: bool, capture: bool) -> dict:
+    """
+    Build the ``subprocess.run`` stdio keyword arguments.
+
+    When output is hidden, stdin is closed too: a TeX error prompt then
+    hits EOF and aborts the run instead of waiting on an invisible ``?``.
+    """
+    if capture:
+        return {
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.STDOUT,
+        }
+    if quiet:
+        return {
+            "stdin": subprocess.DEVNULL,
+            "stdout": subprocess.DEVNULL,
+            "stderr": subprocess.STDOUT,
+        }
+    return {}
+
+@lru_cache(maxsize=None)
+def _probe_pdflatex(exe: str) -> bool:
+    """
+    Run ``<exe> --version`` once and report whether it succeeded.
+    """
+    try:
+        subprocess.run(
+            [exe, "--version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+        return True
+    except Exception:
+        return False
+
 class OsdagLatexEnv:
     """
     OsdagLatexEnv provides a lightweight interface to the LaTeX toolchain
     installed inside the currently active Conda environment.
 
-    The class does not install or configure LaTeX. Instead, it *discovers*
-    the existing LaTeX runtime (binaries and data directories) and exposes:
+    The class does not install LaTeX. Instead, it *discovers* the existing
+    LaTeX runtime (binaries and data directories) and exposes:
 
     - Paths to LaTeX executables (e.g. pdflatex, bibtex)
     - A registry of all available TeX-related binaries
     - Convenience methods to invoke common tools
+    - ``configure_tex`` to point the TeX search paths at the bundled tree
 
     This design treats LaTeX as a system-level toolchain and Python as a
     discovery layer.
     """
+    __slots__ = (
+        "__prefix",
+        "bin_dir",
+        "tex_root",
+        "pdflatex",
+        "_pdflatex_cmd",
+        "_bin",
+        "_available",
+        "_configured",
+    )
+
     def __init__(self):
         """
         Initialize the LaTeX environment by discovering the active Conda
-        prefix, detecting the operating system, and scanning for available
-        LaTeX binaries.
-        """
-        self.__prefix = Path(sys.prefix)
-        self.__system = platform.system().lower()
-        self.__machine = platform.machine().lower()
-        self.bin_dir = self._detect_bin_dir() 
-        self.tex_root = self._detect_tex_root() 
-        self.pdflatex = self._get_pdflatex() 
-
-    # Need correction
-    # def configure_tex(self):
-        
-    #     if (self.tex_root.exists() and self.pdflatex.exists()):
-    #         texmf_dist = str(self.tex_root / "texmf-dist")
-
-    #         os.environ["TEXMFHOME"] = texmf_dist
-    #         os.environ["TEXINPUTS"] = texmf_dist + os.pathsep + os.environ.get("TEXINPUTS", "")
-    #         sty_pkgs = str(self.tex_root / "texmf-dist" / "tex" / "latex").replace("\\", "/")
-    #         pkg_resources = [
-    #             f"{sty_pkgs}/amsmath",
-    #             f"{sty_pkgs}/graphics",
-    #             f"{sty_pkgs}/needspace",
-    #         ]
-
-    #         os.environ["TEXINPUTS"] = ";".join(pkg_resources) + ";" + os.environ["TEXINPUTS"]
-        
+        prefix and the platform-specific LaTeX directories. The binary
+        registry is scanned lazily on first lookup (see ``bin``).
+
+        Candidate prefixes are probed in order (``CONDA_PREFIX``,
+        ``_CONDA_ROOT``, ``sys.prefix``, ``sys.base_prefix``), each at most
+        once, stopping at the first one that contains the LaTeX binaries.
+        If none does, the first candidate with a texmf root is kept.
+        """
+        candidates = dict.fromkeys(
+            p for p in (
+                os.environ.get("CONDA_PREFIX"),
+                os.environ.get("_CONDA_ROOT"),
+                sys.prefix,
+                sys.base_prefix,
+            ) if p
+        )
+        found = None
+        for prefix in candidates:
+            probe = self._probe(prefix)
+            if probe[1] is not None:
+                found = (prefix, probe)
+                break
+            if found is None and probe[0] is not None:
+                found = (prefix, probe)
+        if found is None:
+            found = (next(iter(candidates)), (None, None, None))
+        self.__prefix, (self.tex_root, self.bin_dir, self.pdflatex) = found
+        if self.pdflatex is None:
+            sys_latex = shutil.which("pdflatex")
+            self.pdflatex = None if sys_latex is None else Path(sys_latex)
+        self._pdflatex_cmd = None if self.pdflatex is None else str(self.pdflatex)
+        self._bin = None
+        self._available = None
+        self._configured = False
+
+    def configure_tex(self) -> None:
+        """
+        Point the TeX search paths at the bundled texmf tree.
+
+        Sets ``TEXMFHOME`` and prepends the bundled package directories to
+        ``TEXINPUTS``. Later calls, on this or any other instance, are no-ops
+        once ``TEXINPUTS`` already starts with those directories.
+        """
+        if self._configured:
+            return
+        if not (self.tex_root and self.pdflatex):
+            return
+        self._configured = True
+
+        texmf_dist = str(self.tex_root / "texmf-dist")
+        sty_pkgs = str(self.tex_root / "texmf-dist" / "tex" / "latex").replace("\\", "/")
+        pkg_resources = [
+            f"{sty_pkgs}/amsmath",
+            f"{sty_pkgs}/graphics",
+            f"{sty_pkgs}/needspace",
+        ]
+
+        head = "".join((
+            os.pathsep.join(pkg_resources), os.pathsep,
+            texmf_dist, os.pathsep,
+        ))
+        tex_inputs = os.environ.get("TEXINPUTS", "")
+        if os.environ.get("TEXMFHOME") != texmf_dist:
+            os.environ["TEXMFHOME"] = texmf_dist
+        if not tex_inputs.startswith(head):
+            os.environ["TEXINPUTS"] = head + tex_inputs
+
     @property
     def available(self) -> bool:
         """
         Check whether if Module found in this env.
 
+        This is a cached filesystem check; see ``is_available`` for the
+        optional ``pdflatex --version`` probe.
+
+        Returns
+        -------
+        bool
+            True if osdag_latex_env is available, False otherwise.
+        """
+        if self._available is None:
+            self._available = self.is_available()
+        return self._available
+
+    def is_available(self, verify: bool = False) -> bool:
+        """
+        Check whether the LaTeX runtime is usable.
+
+        Parameters
+        ----------
+        verify : bool, optional
+            Also run ``pdflatex --version`` to confirm the binary starts.
+            The probe is run at most once per process for a given binary.
+
         Returns
         -------
         bool
@@ -62,75 +201,519 @@ class OsdagLatexEnv:
         """
         if not (self.tex_root and self.pdflatex):
             return False
-        try:
-            subprocess.run(
-                [str(self.pdflatex), "--version"],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True,
-            )
-            return True
-        except Exception:
+        if not (self.pdflatex.is_file() and os.access(self.pdflatex, os.X_OK)):
             return False
+        return _probe_pdflatex(str(self.pdflatex)) if verify else True
     
-    def _detect_bin_dir(self) -> Path | None:
+    def _share_dir(self, prefix: str) -> str:
         """
-        Detect the directory containing executables for the current platform.
+        Get the osdag-latex-env data directory inside a Conda prefix.
+
+        Built with ``os.path.join`` so no intermediate ``Path`` objects are
+        created; callers wrap the final result.
+
+        Parameters
+        ----------
+        prefix : str
+            Conda environment root.
+
+        Returns
+        -------
+        str
+            ``<env>/Library/share/osdag_latex_env`` on Windows,
+            ``<env>/share/osdag_latex_env`` elsewhere.
+        """
+        if _SYSTEM == "windows":
+            return os.path.join(prefix, "Library", "share", "osdag_latex_env")
+        return os.path.join(prefix, "share", "osdag_latex_env")
+
+    def _probe(self, prefix: str) -> tuple[Path | None, Path | None, Path | None]:
+        """
+        Locate the texmf root, the platform bin directory and the bundled
+        pdflatex with as few ``stat`` calls as possible.
+
+        The deepest path (pdflatex itself) is checked first; if it exists its
+        parents do too. Shallower paths are only probed on a miss.
 
         On Windows (Conda layout):
-            <env>/Library/share/osdag_latex_env/bin
+            <env>/Library/share/osdag_latex_env/bin/x86_64-windows
 
         On Linux/macOS:
-            <env>/share/osdag_latex_env/bin
+            <env>/share/osdag_latex_env/bin/<x86_64-linux|universal-darwin>
+
+        Parameters
+        ----------
+        prefix : str
+            Conda environment root to probe.
+
+        Returns
+        -------
+        tuple[Path | None, Path | None, Path | None]
+            ``(tex_root, bin_dir, pdflatex)``, each None if not found.
+        """
+        share = self._share_dir(prefix)
+        if _PLATFORM_BIN is not None:
+            bin_dir = os.path.join(share, "bin", _PLATFORM_BIN)
+            exe = os.path.join(bin_dir, _PDFLATEX_EXE)
+            if os.path.exists(exe):
+                return Path(share), Path(bin_dir), Path(exe)
+            if os.path.exists(bin_dir):
+                return Path(share), Path(bin_dir), None
+        return (Path(share) if os.path.exists(share) else None), None, None
+
+    @property
+    def bin(self) -> dict[str, str]:
+        """
+        Registry of the LaTeX executables found in ``bin_dir``.
+
+        Paths are stored as plain strings; ``get`` wraps the requested one
+        in a ``Path``.
+
+        The directory is scanned on first access only, so callers that just
+        need ``pdflatex`` never pay for the full scan.
+        """
+        if self._bin is None:
+            self._bin = self._discover_binaries()
+        return self._bin
+
+    def _discover_binaries(self) -> dict[str, str]:
+        """
+        Build a registry of the executables found in ``bin_dir``.
+
+        Uses ``os.scandir`` so the file-type check is served from the cached
+        directory entry instead of an extra ``stat`` per file. Libraries and
+        data files shipped next to the executables (``.dll``, ``.so``,
+        ``.map``, ...) are skipped by extension.
+
+        Returns
+        -------
+        dict[str, str]
+            Mapping of lowercase executable name (without extension) to its path.
+        """
+        if self.bin_dir is None:
+            return {}
+        bins = {}
+        try:
+            with os.scandir(self.bin_dir) as it:
+                for e in it:
+                    stem, ext = os.path.splitext(e.name)
+                    if ext.lower() in _EXE_SUFFIXES and e.is_file():
+                        bins[sys.intern(stem.lower())] = e.path
+        except FileNotFoundError:
+            return {}
+        return bins
+
+    def has(self, name: str) -> bool:
+        """
+        Check whether a LaTeX executable is present in the registry.
+
+        Kept for backward compatibility; prefer ``try_get``, which answers
+        the same question and returns the path in a single lookup.
+
+        Parameters
+        ----------
+        name : str
+            Executable name, e.g. ``"bibtex"``.
+
+        Returns
+        -------
+        bool
+            True if the executable was discovered, False otherwise.
+        """
+        return name.lower() in self.bin
+
+    def try_get(self, name: str) -> Path | None:
+        """
+        Get the path to a LaTeX executable, or None if it is not available.
+
+        Parameters
+        ----------
+        name : str
+            Executable name, e.g. ``"bibtex"``.
 
         Returns
         -------
         Path | None
-            Path to the directory containing LaTeX executables.
+            Absolute path to the executable, None if not found.
         """
-        if self.__system == "windows":
-            dir = self.__prefix / "Library" / "share" / "osdag_latex_env" / "bin" / "x86_64-windows"
-            return dir if dir.exists() else None
-        elif self.__system == "linux":
-            dir = self.__prefix / "share" / "osdag_latex_env" / "bin" / "x86_64-linux"
-            return dir if dir.exists() else None
-        elif self.__system == "darwin":
-            dir = self.__prefix / "share" / "osdag_latex_env" / "bin" / "universal-darwin"
-            return dir if dir.exists() else None
+        p = self.bin.get(name.lower())
+        return None if p is None else Path(p)
 
-    def _detect_tex_root(self) -> Path | None:
+    def get(self, name: str) -> Path:
         """
-        Detect the root directory containing the LaTeX data tree (texmf).
+        Get the path to a LaTeX executable from the registry.
 
-        This is where packages, fonts, and configuration files live.
+        Parameters
+        ----------
+        name : str
+            Executable name, e.g. ``"bibtex"``.
 
         Returns
         -------
         Path
-            Path to the osdag-latex-env texmf root.
+            Absolute path to the executable.
+
+        Raises
+        ------
+        RuntimeError
+            If the executable was not discovered.
         """
-        if self.__system == "windows":
-            dir = self.__prefix / "Library" / "share" / "osdag_latex_env"
-            return dir if dir.exists() else None
-        else:
-            dir = self.__prefix / "share" / "osdag_latex_env"
-            return dir if dir.exists() else None
-        
-    def _get_pdflatex(self) -> Path | None:
+        p = self.bin.get(name.lower())
+        if p is None:
+            raise RuntimeError(f"{name} not found in {self.bin_dir}")
+        return Path(p)
+
+    def run(
+        self,
+        name: str,
+        args: list[str] | None = None,
+        capture: bool = False,
+        quiet: bool = False,
+    ) -> subprocess.CompletedProcess:
         """
-        Get the path to the pdflatex executable.
+        Run a LaTeX executable from the registry.
+
+        Parameters
+        ----------
+        name : str
+            Executable name, e.g. ``"bibtex"``.
+        args : list[str], optional
+            Command-line arguments passed to the executable.
+        capture : bool, optional
+            Capture stdout and stderr (merged) into the result's ``stdout``.
+        quiet : bool, optional
+            Discard stdout and stderr. Ignored when ``capture`` is set.
 
         Returns
         -------
-        Path | None
-            Absolute path to pdflatex, None if not found.
-        """
-        exe = "pdflatex.exe" if self.__system == "windows" else "pdflatex"
-        if self.bin_dir and (self.bin_dir / exe).exists():
-            return self.bin_dir / exe
-        sys_latex = shutil.which("pdflatex")
-        if sys_latex is not None:
-            return Path(sys_latex)
-        return None
-    
-    
+        subprocess.CompletedProcess
+            Result of the invocation.
+        """
+        cmd = [str(self.get(name))]
+        if args:
+            cmd.extend(args)
+        return subprocess.run(cmd, **_stdio(quiet, capture))
+
+    def compile(
+        self,
+        tex_file: str,
+        extra_args: list[str] | None = None,
+        quiet: bool = True,
+        capture_log: bool = False,
+    ) -> subprocess.CompletedProcess:
+        """
+        Compile a single ``.tex`` file with pdflatex.
+
+        Parameters
+        ----------
+        tex_file : str
+            Path to the ``.tex`` file.
+        extra_args : list[str], optional
+            Additional pdflatex arguments placed before the file name.
+        quiet : bool, optional
+            Discard the console output. Defaults to True; the full log is
+            still written to the ``.log`` file.
+        capture_log : bool, optional
+            Capture the console output into the result's ``stdout``.
+
+        Returns
+        -------
+        subprocess.CompletedProcess
+            Result of the pdflatex invocation.
+
+        Raises
+        ------
+        RuntimeError
+            If pdflatex could not be found.
+        """
+        if self._pdflatex_cmd is None:
+            raise RuntimeError("pdflatex not found")
+        cmd = [self._pdflatex_cmd]
+        if extra_args:
+            cmd.extend(extra_args)
+        cmd.append(tex_file)
+        return subprocess.run(cmd, **_stdio(quiet, capture_log))
+
+    def compile_draft(
+        self,
+        tex_file: str,
+        extra_args: list[str] | None = None,
+        quiet: bool = True,
+    ) -> subprocess.CompletedProcess:
+        """
+        Run an intermediate pdflatex pass that only updates auxiliary files.
+
+        ``-draftmode`` skips writing the PDF (and loading included images),
+        which is all an intermediate pass of a multi-pass build needs to
+        refresh ``.aux``/``.toc``.
+
+        Parameters
+        ----------
+        tex_file : str
+            Path to the ``.tex`` file.
+        extra_args : list[str], optional
+            Additional pdflatex arguments placed before the file name.
+        quiet : bool, optional
+            Discard the console output. Defaults to True.
+
+        Returns
+        -------
+        subprocess.CompletedProcess
+            Result of the pdflatex invocation.
+        """
+        args = ["-interaction=batchmode", "-halt-on-error", "-draftmode"]
+        if extra_args:
+            args += extra_args
+        return self.compile(tex_file, args, quiet=quiet)
+
+    def compile_full(
+        self,
+        tex_file: str,
+        passes: int = 3,
+        extra_args: list[str] | None = None,
+        quiet: bool = True,
+    ) -> subprocess.CompletedProcess:
+        """
+        Compile a ``.tex`` file in several passes, emitting the PDF only once.
+
+        The first ``passes - 1`` runs use ``compile_draft``; the last one is a
+        regular ``compile``. Stops early if a draft pass fails.
+
+        Parameters
+        ----------
+        tex_file : str
+            Path to the ``.tex`` file.
+        passes : int, optional
+            Total number of pdflatex runs. Defaults to 3.
+        extra_args : list[str], optional
+            Additional pdflatex arguments applied to every pass.
+        quiet : bool, optional
+            Discard the console output. Defaults to True.
+
+        Returns
+        -------
+        subprocess.CompletedProcess
+            Result of the last pdflatex invocation that was run.
+        """
+        for _ in range(passes - 1):
+            result = self.compile_draft(tex_file, extra_args, quiet=quiet)
+            if result.returncode != 0:
+                return result
+        return self.compile(tex_file, extra_args, quiet=quiet)
+
+    def compile_batch(
+        self,
+        tex_files: list[str],
+        extra_args: list[str] | None = None,
+        max_workers: int | None = None,
+        quiet: bool = True,
+    ) -> list[subprocess.CompletedProcess]:
+        """
+        Compile several ``.tex`` files, overlapping the pdflatex runs.
+
+        Each document is compiled by its own pdflatex process, but the
+        processes run concurrently so their startup (format load, kpathsea
+        initialization) is hidden behind each other instead of paid in
+        sequence. Every job writes its ``.aux``/``.log``/``.pdf`` into the
+        current directory, so the files must have distinct stems.
+
+        Parameters
+        ----------
+        tex_files : list[str]
+            Paths to the ``.tex`` files.
+        extra_args : list[str], optional
+            Additional pdflatex arguments applied to every file.
+        max_workers : int, optional
+            Maximum number of concurrent pdflatex processes. Defaults to
+            ``os.cpu_count()``.
+        quiet : bool, optional
+            Discard the console output. Defaults to True.
+
+        Returns
+        -------
+        list[subprocess.CompletedProcess]
+            Results in the same order as ``tex_files``.
+
+        Raises
+        ------
+        ValueError
+            If two files share a stem and would overwrite each other's output.
+        """
+        stems = [Path(t).stem for t in tex_files]
+        if len(set(stems)) != len(stems):
+            dupes = sorted({s for s in stems if stems.count(s) > 1})
+            raise ValueError(f"duplicate job names in batch: {', '.join(dupes)}")
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda t: self.compile(t, extra_args, quiet=quiet), tex_files))
+
+
+@lru_cache(maxsize=1)
+def get_env() -> OsdagLatexEnv:
+    """
+    Get the shared OsdagLatexEnv for this process.
+
+    This is the preferred entry point: the prefix, platform and TeX tree do
+    not change during the process lifetime, so every caller can reuse one
+    discovery pass. Use ``get_env.cache_clear()`` to force rediscovery
+    (e.g. after patching ``sys.prefix`` or ``CONDA_PREFIX`` in tests).
+
+    Returns
+    -------
+    OsdagLatexEnv
+        The cached environment instance.
+    """
+    return OsdagLatexEnv()
+
+
+class PdflatexDaemon:
+    """
+    Keeps a pdflatex process started ahead of each compile.
+
+    A TeX run ends at ``\\end{document}``, so one process cannot serve several
+    documents. Instead the daemon always holds a *standby* pdflatex that has
+    already been spawned and is waiting on stdin. ``compile`` feeds it
+    ``\\input{<file>}`` and immediately spawns the next standby, so process
+    creation and kpathsea initialization overlap with the current compile
+    rather than preceding the next one.
+
+    Standby processes run under a private job name; once a document is done,
+    its output files (``.pdf``, ``.log``, ``.aux``, ...) are renamed to the
+    ``.tex`` file's stem. Before each run the document's auxiliary files
+    (``<stem>.aux``, ``.toc``, ``.bbl``, ... see ``_AUX_SUFFIXES``) are moved
+    to the job name, so successive calls behave like multi-pass builds with
+    ``compile``. Other ``<stem>.*`` files (sources, images) are left alone.
+    """
+    def __init__(
+        self,
+        env: OsdagLatexEnv | None = None,
+        extra_args: list[str] | None = None,
+        cwd: str | None = None,
+    ):
+        """
+        Start the first standby pdflatex process.
+
+        Parameters
+        ----------
+        env : OsdagLatexEnv, optional
+            Environment providing pdflatex. Defaults to ``get_env()``.
+        extra_args : list[str], optional
+            Additional pdflatex arguments applied to every compile.
+        cwd : str, optional
+            Working directory for pdflatex; output files are written here.
+            Defaults to the current directory.
+
+        Raises
+        ------
+        RuntimeError
+            If pdflatex could not be found.
+        """
+        env = env or get_env()
+        if env.pdflatex is None:
+            raise RuntimeError("pdflatex not found")
+        self._cmd = [str(env.pdflatex), "-interaction=batchmode"]
+        if extra_args:
+            self._cmd.extend(extra_args)
+        self.cwd = cwd or os.getcwd()
+        self._proc, self._jobname = self._spawn()
+
+    def _spawn(self) -> tuple[subprocess.Popen, str]:
+        """
+        Start a standby pdflatex process waiting for its first input line.
+        """
+        jobname = f"_osdag_tex_{os.getpid()}_{next(_JOB_IDS)}"
+        proc = subprocess.Popen(
+            self._cmd + [f"-jobname={jobname}"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.STDOUT,
+            cwd=self.cwd,
+        )
+        return proc, jobname
+
+    def _move_aux(self, src: str, dst: str) -> None:
+        """
+        Rename the ``<src>`` auxiliary files in ``cwd`` to ``<dst>``.
+        """
+        for ext in _AUX_SUFFIXES:
+            try:
+                os.replace(
+                    os.path.join(self.cwd, src + ext),
+                    os.path.join(self.cwd, dst + ext),
+                )
+            except FileNotFoundError:
+                pass
+
+    def _rename(self, src: str, dst: str) -> None:
+        """
+        Rename every ``<src>.*`` file in ``cwd`` to ``<dst>.*``.
+        """
+        prefix = src + "."
+        with os.scandir(self.cwd) as it:
+            names = [e.name for e in it if e.name.startswith(prefix)]
+        for name in names:
+            os.replace(
+                os.path.join(self.cwd, name),
+                os.path.join(self.cwd, dst + name[len(src):]),
+            )
+
+    def compile(self, tex_file: str) -> subprocess.CompletedProcess:
+        """
+        Compile a ``.tex`` file on the standby process.
+
+        Parameters
+        ----------
+        tex_file : str
+            Path to the ``.tex`` file.
+
+        Returns
+        -------
+        subprocess.CompletedProcess
+            Result of the pdflatex invocation.
+
+        Raises
+        ------
+        RuntimeError
+            If the daemon has been closed.
+        """
+        if self._proc is None:
+            raise RuntimeError("PdflatexDaemon is closed")
+        proc, jobname = self._proc, self._jobname
+        self._proc, self._jobname = self._spawn()
+
+        tex_path = Path(tex_file)
+        stem = tex_path.stem
+        line = f"\\input{{{tex_path.resolve().as_posix()}}}\n"
+        try:
+            self._move_aux(stem, jobname)
+            proc.communicate(line.encode())
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            self._rename(jobname, stem)
+        return subprocess.CompletedProcess(proc.args, proc.returncode)
+
+    def close(self) -> None:
+        """
+        Stop the standby pdflatex process. Further ``compile`` calls raise.
+        """
+        if self._proc is None:
+            return
+        if self._proc.poll() is None:
+            self._proc.kill()
+        self._proc.communicate()
+        self._proc = None
+
+    def __enter__(self) -> "PdflatexDaemon":
+        """
+        Return the daemon for use in a ``with`` block.
+        """
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """
+        Stop the standby process on leaving the ``with`` block.
+        """
+        self.close()